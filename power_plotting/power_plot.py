@@ -6,102 +6,140 @@ from typing import Tuple
 
 class PerformancePlotter:
     """Handles geometry and Plotly visualizations directly from DataFrame rows."""
-    
+
+    # Parametric angles for the envelope outline, shared by every row and plot;
+    # 48 points is visually smooth at typical plot sizes
+    _N = 48
+    _T = np.linspace(0, 2 * np.pi, _N)
+    _COS_T = np.cos(_T)
+    _SIN_T = np.sin(_T)
+
     def __init__(self, is_log_y: bool = True):
         self.is_log_y = is_log_y
         self.fig = go.Figure()
+        # Plain trace dicts collected by add_data, validated in one pass by finalize
+        self._traces = []
         # Use a monotonic/sequential scale (e.g., 'Blues_r' for a professional look)
         self.colors = px.colors.sequential.Cividis
 
-    def _get_envelope_coords(self, pwr_min, pwr_max, perf_min, perf_max, df_context=None) -> Tuple[np.ndarray, np.ndarray]:
-        """Calculates tilted ellipsoid coordinates using normalized space to maintain alignment."""
-        # 1. Coordinate Space Transformation (Log handling)
-        x1, x2 = pwr_min, pwr_max
-        y1, y2 = (np.log10(perf_min), np.log10(perf_max)) if self.is_log_y else (perf_min, perf_max)
-
-        # 2. Normalization (Advanced Aspect Ratio Handling)
-        # If we have the full data range, we can normalize to a 0-1 square
-        # This prevents the 'stretching' effect on the rotation angle
-        if df_context is not None and not self.is_log_y:
-            x_range = df_context['pwr_max'].max() - df_context['pwr_min'].min()
-            y_range = df_context['perf_max'].max() - df_context['perf_min'].min()
-
-            # Scale factor to equalize visual units
-            scale_y = x_range / y_range if y_range != 0 else 1.0
-            y1_norm, y2_norm = y1 * scale_y, y2 * scale_y
+    def _get_envelope_coords_batch(self, x1, x2, y1, y2, x_range=None, y_range=None) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized envelope geometry for all rows at once, returning (N, _N) float32 x/y arrays.
+
+        y1/y2 are expected in plot space (already log10-transformed when is_log_y).
+        x_range/y_range are the full data spans used for linear-mode normalization.
+        """
+        x1, x2 = np.asarray(x1, dtype=float), np.asarray(x2, dtype=float)
+        y1, y2 = np.asarray(y1, dtype=float), np.asarray(y2, dtype=float)
+
+        # 1. Normalization (Advanced Aspect Ratio Handling)
+        # A zero or non-finite span cannot define a scale, so fall back to 1.0
+        if (x_range is not None and y_range is not None and not self.is_log_y
+                and np.isfinite(x_range) and np.isfinite(y_range) and x_range != 0 and y_range != 0):
+            scale_y = x_range / y_range
         else:
             scale_y = 1.0
-            y1_norm, y2_norm = y1, y2
 
-        # 3. Geometry Calculation in (Normalized) Space
+        y1_norm, y2_norm = y1 * scale_y, y2 * scale_y
+
+        # 2. Geometry Calculation in (Normalized) Space
         cx, cy_norm = (x1 + x2) / 2, (y1_norm + y2_norm) / 2
         dx, dy_norm = x2 - x1, y2_norm - y1_norm
-        dist = np.sqrt(dx**2 + dy_norm**2)
+        dist = np.hypot(dx, dy_norm)
         angle = np.arctan2(dy_norm, dx)
 
-        if dist == 0:
-            return np.array([cx]), np.array([10**y1 if self.is_log_y else y1])
-
         a = dist / 2
         if self.is_log_y:
-            # Revert to original b calculation for log scale (half perpendicular distance)
-            b = (dx * dy_norm) / (2 * dist)
+            # Degenerate rows (dist == 0) collapse to their center point
+            with np.errstate(divide='ignore', invalid='ignore'):
+                b = np.where(dist == 0, 0.0, (dx * dy_norm) / (2 * dist))
         else:
-            # Use constant factor for linear scale to ensure visibility
             b = a * 0.2
 
-        # 4. Generate and Rotate Points
-        t = np.linspace(0, 2 * np.pi, 100)
-        xs, ys = a * np.cos(t), b * np.sin(t)
+        # 3. Generate and Rotate Points, broadcasting (N, 1) against (_N,)
+        xs, ys = a[:, None] * self._COS_T, b[:, None] * self._SIN_T
+        cos_a, sin_a = np.cos(angle)[:, None], np.sin(angle)[:, None]
 
-        x_rot = cx + (xs * np.cos(angle) - ys * np.sin(angle))
-        y_rot_norm = cy_norm + (xs * np.sin(angle) + ys * np.cos(angle))
+        x_rot = cx[:, None] + (xs * cos_a - ys * sin_a)
+        y_rot_norm = cy_norm[:, None] + (xs * sin_a + ys * cos_a)
 
-        # 5. Reverse Normalization and Log Transform
+        # 4. Reverse Normalization and Log Transform
         y_final = y_rot_norm / scale_y
-        return x_rot, (10 ** y_final if self.is_log_y else y_final)
+        y_final = 10 ** y_final if self.is_log_y else y_final
+        # float32 halves the serialized trace payload with no visible loss at this resolution
+        return x_rot.astype(np.float32, copy=False), y_final.astype(np.float32, copy=False)
 
     def add_data(self, df: pd.DataFrame):
-        """Iterates through the DataFrame and adds traces to the figure."""
+        """Iterates through the DataFrame and queues traces for the figure."""
         n_items = len(df)
-        for i, row in enumerate(df.itertuples()):
-            # Select color from the monotonic scale
-            color_idx = int((i / max(1, n_items - 1)) * (len(self.colors) - 1))
-            color = self.colors[color_idx]
+        names = df['name'].to_numpy()
+        # Pull the numeric columns as one float64 block, transposed to (4, N) so
+        # each unpacked column is contiguous for the broadcasting path
+        vals = df[['pwr_min', 'pwr_max', 'perf_min', 'perf_max']].to_numpy(dtype=np.float64)
+        pwr_min, pwr_max, perf_min, perf_max = np.ascontiguousarray(vals.T)
+
+        # Transform to plot space once for the whole column, not per row
+        if self.is_log_y:
+            y1, y2 = np.log10(perf_min), np.log10(perf_max)
+        else:
+            y1, y2 = perf_min, perf_max
+
+        # Normalization context for linear mode, reduced once for the whole table
+        x_range = df['pwr_max'].max() - df['pwr_min'].min()
+        y_range = df['perf_max'].max() - df['perf_min'].min()
+        x_envs, y_envs = self._get_envelope_coords_batch(pwr_min, pwr_max, y1, y2, x_range=x_range, y_range=y_range)
+
+        # Label centers (geometric mean of the range in log mode)
+        label_x = (pwr_min + pwr_max) / 2
+        label_y = 10 ** ((y1 + y2) / 2) if self.is_log_y else (y1 + y2) / 2
+
+        # Select colors from the monotonic scale, spread evenly across rows
+        color_idxs = (np.arange(n_items) / max(1, n_items - 1) * (len(self.colors) - 1)).astype(np.intp)
+        row_colors = [self.colors[k] for k in color_idxs]
+        # One envelope line style per palette color, shared by every row that uses it
+        line_styles = {color: {"color": color, "width": 1.5} for color in set(row_colors)}
+
+        for i in range(n_items):
+            name = names[i]
+            color = row_colors[i]
 
-            x_env, y_env = self._get_envelope_coords(row.pwr_min, row.pwr_max, row.perf_min, row.perf_max, df_context=df)
+            x_env, y_env = x_envs[i], y_envs[i]
 
             # Add Envelope with the monotonic color
-            self.fig.add_trace(go.Scatter(
-                x=x_env, y=y_env, fill="toself", fillcolor=color, opacity=0.3,
-                line=dict(color=color, width=1.5), name=row.name,
-                legendgroup=row.name, hoverinfo='skip'
-            ))
-
-            # Add Markers
-            self.fig.add_trace(go.Scatter(
-                x=[row.pwr_min, row.pwr_max], y=[row.perf_min, row.perf_max],
-                mode='markers', marker=dict(color=color, size=8, symbol='circle'),
-                name=f"{row.name} Range", legendgroup=row.name, showlegend=False
-            ))
-
-            # Add Label inside the ellipse
-            cx = (row.pwr_min + row.pwr_max) / 2
-            cy = np.sqrt(row.perf_min * row.perf_max) if self.is_log_y else (row.perf_min + row.perf_max) / 2
-
-            self.fig.add_trace(go.Scatter(
-                x=[cx], y=[cy],
-                mode='text',
-                text=[row.name],
-                textposition="middle center",
-                textfont=dict(color="black", size=10),
-                showlegend=False,
-                legendgroup=row.name,
-                hoverinfo='skip'
-            ))
+            self._traces.append({
+                "type": "scatter", "x": x_env, "y": y_env, "fill": "toself", "fillcolor": color, "opacity": 0.3,
+                "line": line_styles[color], "name": name,
+                "legendgroup": name, "hoverinfo": "skip"
+            })
+
+        # Add every device's range markers as one trace, interleaved min/max per row
+        self._traces.append({
+            "type": "scatter",
+            "x": np.column_stack((pwr_min, pwr_max)).ravel(),
+            "y": np.column_stack((perf_min, perf_max)).ravel(),
+            "mode": "markers",
+            "marker": {"color": np.repeat(row_colors, 2), "size": 8, "symbol": "circle"},
+            "hovertext": np.repeat([f"{name} Range" for name in names], 2),
+            "hoverinfo": "x+y+text",
+            "showlegend": False
+        })
+
+        # Add all labels inside their ellipses as one text trace; the styling is
+        # uniform, so a per-device trace would only add Plotly overhead
+        self._traces.append({
+            "type": "scatter", "x": label_x, "y": label_y,
+            "mode": "text",
+            "text": names,
+            "textposition": "middle center",
+            "textfont": {"color": "black", "size": 10},
+            "showlegend": False,
+            "hoverinfo": "skip"
+        })
 
     def finalize(self, title: str):
-        """Styles the layout and returns the figure."""
+        """Adds the queued traces, styles the layout and returns the figure."""
+        # One bulk add validates every trace together instead of once per add_trace call
+        self.fig.add_traces(self._traces)
+        self._traces = []
         self.fig.update_xaxes(title="Power Consumption (Watts)", gridcolor='lightgrey')
         y_title = "AI Performance (TOPS)"
         if self.is_log_y:
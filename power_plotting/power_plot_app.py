@@ -1,11 +1,36 @@
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs_version
 from power_plot import PerformancePlotter
 import io
 import zipfile
 import re
 
 
+# st.cache_data is shared by every session on the server, so bound each helper's cache
+CACHE_MAX_ENTRIES = 32
+
+
+# Standalone HTML export; only the figure JSON changes between downloads
+HTML_TEMPLATE = """<!doctype html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <style>html, body {{height: 100%;}}</style>
+</head>
+<body>
+    <div id="plot" style="height:100%; width:100%;"></div>
+    <script charset="utf-8" src="https://cdn.plot.ly/plotly-{plotlyjs_version}.min.js"></script>
+    <script>
+        var fig = {fig_json};
+        Plotly.newPlot("plot", fig.data, fig.layout, {{"responsive": true}});
+    </script>
+</body>
+</html>
+"""
+
+
 def sanitize_filename(name, default="plot"):
     # Replace spaces with underscores
     name = name.replace(" ", "_")
@@ -14,6 +39,51 @@ def sanitize_filename(name, default="plot"):
     return name if name else default
 
 
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def load_df(file_bytes: bytes, name: str) -> pd.DataFrame:
+    # Keyed on the upload's bytes, so reruns skip re-parsing (openpyxl is slow)
+    if name.lower().endswith(".csv"):
+        return pd.read_csv(io.BytesIO(file_bytes))
+    return pd.read_excel(io.BytesIO(file_bytes))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_figure(df: pd.DataFrame, is_log_y: bool) -> go.Figure:
+    # Cached on the table contents and scale only, so title/label edits reuse the traces
+    plotter = PerformancePlotter(is_log_y=is_log_y)
+    plotter.add_data(df)
+    fig = plotter.finalize(title="")
+    fig.update_xaxes(title="Power (W)")
+    return fig
+
+
+def style_figure(df: pd.DataFrame, is_log_y: bool, plot_title: str, y_axis_title: str) -> go.Figure:
+    # Titles only touch the layout of the (copied) cached figure
+    fig = build_figure(df, is_log_y)
+    fig.update_layout(title=plot_title)
+    fig.update_yaxes(title=y_axis_title)
+    return fig
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_png(df: pd.DataFrame, is_log_y: bool, plot_title: str, y_axis_title: str) -> bytes:
+    # Kaleido export is the slowest step, so it gets its own cache entry
+    return style_figure(df, is_log_y, plot_title, y_axis_title).to_image(format="png")
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def build_html(df: pd.DataFrame, is_log_y: bool, plot_title: str, y_axis_title: str) -> bytes:
+    # Fill the fixed template directly instead of going through fig.to_html
+    fig_json = style_figure(df, is_log_y, plot_title, y_axis_title).to_json()
+    return HTML_TEMPLATE.format(plotlyjs_version=get_plotlyjs_version(), fig_json=fig_json).encode()
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    # to_csv formats every cell in Python, so only redo it when the table changes
+    return df.to_csv(index=False).encode('utf-8')
+
+
 def main():
     st.set_page_config(page_title="Performance Plotter", layout="wide")
     st.title("Performance Envelope Visualizer")
@@ -38,10 +108,7 @@ def main():
     # 1) Load data
     if uploaded_file is not None:
         try:
-            if uploaded_file.name.lower().endswith(".csv"):
-                df_input = pd.read_csv(uploaded_file)
-            else:
-                df_input = pd.read_excel(uploaded_file)
+            df_input = load_df(uploaded_file.getvalue(), uploaded_file.name)
             
             # Ensure required columns exist and have correct types
             for col in required_cols:
@@ -88,16 +155,10 @@ def main():
     # 4) Build and render plot
     if not edited_df.empty and set(required_cols).issubset(edited_df.columns):
         try:
-            plotter = PerformancePlotter(is_log_y=is_log_y)
-            plotter.add_data(edited_df)
-            fig = plotter.finalize(plot_title)
-
-            # Override axis labels
-            fig.update_xaxes(title="Power (W)")
             y_axis_title = f"{y_label} ({y_unit})"
             if is_log_y:
                 y_axis_title += " (log scale)"
-            fig.update_yaxes(title=y_axis_title)
+            fig = style_figure(edited_df, is_log_y, plot_title, y_axis_title)
 
             st.plotly_chart(fig, width="stretch")
 
@@ -108,7 +169,7 @@ def main():
             base_name = sanitize_filename(plot_title, default="performance_plot")
 
             # 1. Download HTML
-            html_bytes = fig.to_html(include_plotlyjs='cdn').encode()
+            html_bytes = build_html(edited_df, is_log_y, plot_title, y_axis_title)
             with col1:
                 st.download_button(
                     label="Download HTML",
@@ -117,23 +178,30 @@ def main():
                     mime="text/html",
                 )
 
-            # 2. Download PNG
-            try:
-                png_bytes = fig.to_image(format="png")
-                with col2:
+            # PNG and ZIP are prepared on demand; drop any built for an earlier plot
+            assets_key = (int(pd.util.hash_pandas_object(edited_df).sum()), is_log_y, plot_title, y_axis_title)
+            if st.session_state.get("assets_key") != assets_key:
+                st.session_state.assets_key = assets_key
+                st.session_state.pop("png_bytes", None)
+                st.session_state.pop("zip_bytes", None)
+
+            # 2. Download PNG (Kaleido only runs once requested)
+            with col2:
+                if st.button("Prepare PNG"):
+                    try:
+                        st.session_state.png_bytes = build_png(edited_df, is_log_y, plot_title, y_axis_title)
+                    except Exception as e:
+                        st.error(f"Error generating PNG: {e}")
+                if "png_bytes" in st.session_state:
                     st.download_button(
                         label="Download PNG",
-                        data=png_bytes,
+                        data=st.session_state.png_bytes,
                         file_name=f"{base_name}.png",
                         mime="image/png",
                     )
-            except Exception as e:
-                with col2:
-                    st.error(f"Error generating PNG: {e}")
-                png_bytes = None
 
             # 3. Download CSV (from the editor)
-            csv_bytes = edited_df.to_csv(index=False).encode('utf-8')
+            csv_bytes = df_to_csv_bytes(edited_df)
             with col3:
                 st.download_button(
                     label="Download CSV",
@@ -142,21 +210,32 @@ def main():
                     mime="text/csv",
                 )
 
-            # 4. Download All (ZIP)
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w") as zf:
-                zf.writestr(f"{base_name}.html", html_bytes)
-                if png_bytes:
-                    zf.writestr(f"{base_name}.png", png_bytes)
-                zf.writestr(f"{base_name}_data.csv", csv_bytes)
-            
+            # 4. Download All (ZIP), assembled only once requested
             with col4:
-                st.download_button(
-                    label="Download All (ZIP)",
-                    data=zip_buffer.getvalue(),
-                    file_name=f"{base_name}_assets.zip",
-                    mime="application/zip",
-                )
+                if st.button("Prepare All (ZIP)"):
+                    png_bytes = st.session_state.get("png_bytes")
+                    if png_bytes is None:
+                        try:
+                            png_bytes = build_png(edited_df, is_log_y, plot_title, y_axis_title)
+                            st.session_state.png_bytes = png_bytes
+                        except Exception as e:
+                            st.error(f"Error generating PNG: {e}")
+
+                    zip_buffer = io.BytesIO()
+                    # Fast deflate shrinks the text HTML/CSV members; the PNG is already compressed
+                    with zipfile.ZipFile(zip_buffer, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                        zf.writestr(f"{base_name}.html", html_bytes)
+                        if png_bytes:
+                            zf.writestr(f"{base_name}.png", png_bytes, compress_type=zipfile.ZIP_STORED)
+                        zf.writestr(f"{base_name}_data.csv", csv_bytes)
+                    st.session_state.zip_bytes = zip_buffer.getvalue()
+                if "zip_bytes" in st.session_state:
+                    st.download_button(
+                        label="Download All (ZIP)",
+                        data=st.session_state.zip_bytes,
+                        file_name=f"{base_name}_assets.zip",
+                        mime="application/zip",
+                    )
 
         except Exception as e:
             st.error(f"Error generating plot: {e}")
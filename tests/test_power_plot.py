@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from power_plotting.power_plot import PerformancePlotter
+
+CASES = {
+    "mixed": pd.DataFrame({
+        'name': ['Nano', 'Orin', 'Missing', 'Fixed'],
+        'pwr_min': [5.0, 15.0, np.nan, 10.0],
+        'pwr_max': [10.0, 60.0, 20.0, 10.0],
+        'perf_min': [0.2, 50.0, 1.0, 14.0],
+        'perf_max': [0.5, 275.0, 2.0, 14.0],
+    }),
+    "zero_x_range": pd.DataFrame({
+        'name': ['A', 'B'],
+        'pwr_min': [15.0, 15.0],
+        'pwr_max': [15.0, 15.0],
+        'perf_min': [1.0, 4.0],
+        'perf_max': [3.0, 8.0],
+    }),
+}
+
+
+def _plot(df, is_log_y):
+    plotter = PerformancePlotter(is_log_y=is_log_y)
+    plotter.add_data(df)
+    return plotter.finalize("test")
+
+
+@pytest.mark.parametrize("is_log_y", [True, False])
+@pytest.mark.parametrize("case", CASES)
+def test_envelopes(case, is_log_y):
+    df = CASES[case]
+    fig = _plot(df, is_log_y)
+    # One envelope per row, then the shared marker and label traces
+    assert len(fig.data) == len(df) + 2
+
+    for row, trace in zip(df.itertuples(), fig.data):
+        x, y = np.asarray(trace.x, dtype=float), np.asarray(trace.y, dtype=float)
+        assert x.shape == y.shape == (PerformancePlotter._N,)
+        if np.isnan([row.pwr_min, row.pwr_max, row.perf_min, row.perf_max]).any():
+            continue
+        assert np.isfinite(x).all() and np.isfinite(y).all()
+        # The outline starts and closes on the (pwr_max, perf_max) corner of the range
+        np.testing.assert_allclose([x[0], x[-1]], row.pwr_max, rtol=1e-5)
+        np.testing.assert_allclose([y[0], y[-1]], row.perf_max, rtol=1e-5)
+        if row.pwr_min == row.pwr_max and row.perf_min == row.perf_max:
+            # A zero-length range collapses to its center point
+            np.testing.assert_allclose(x, row.pwr_min, rtol=1e-5)
+            np.testing.assert_allclose(y, row.perf_min, rtol=1e-5)
+
+
+def test_markers_interleave_ranges():
+    df = CASES["mixed"]
+    markers = _plot(df, is_log_y=True).data[len(df)]
+    np.testing.assert_array_equal(markers.x, df[['pwr_min', 'pwr_max']].to_numpy().ravel())
+    np.testing.assert_array_equal(markers.y, df[['perf_min', 'perf_max']].to_numpy().ravel())